@@ -19,6 +19,7 @@ Run:
 import pygame
 import random
 import sys
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 
@@ -29,9 +30,48 @@ FPS = 60
 
 TILE_SIZE = 32
 PLAYER_SPEED = 160  # pixels per second
+DIAG_SPEED = PLAYER_SPEED * 0.7071  # per-axis speed when moving diagonally
+OBSTACLE_CELL = 128  # grid cell size (pixels) for the obstacle broad-phase
+
+# (vx_sign, vy_sign) -> velocity in px/sec, with diagonal normalization baked
+# in so the per-frame movement path is a single dict lookup and two multiplies
+_MOVE = {
+    (0, 0): (0.0, 0.0),
+    (-1, 0): (-PLAYER_SPEED, 0.0),
+    (1, 0): (PLAYER_SPEED, 0.0),
+    (0, -1): (0.0, -PLAYER_SPEED),
+    (0, 1): (0.0, PLAYER_SPEED),
+    (-1, -1): (-DIAG_SPEED, -DIAG_SPEED),
+    (1, -1): (DIAG_SPEED, -DIAG_SPEED),
+    (-1, 1): (-DIAG_SPEED, DIAG_SPEED),
+    (1, 1): (DIAG_SPEED, DIAG_SPEED),
+}
+
+def _build_dir_lut():
+    # 16-entry table indexed by a key bitmask (bit 0=left, 1=right, 2=up,
+    # 3=down) so the per-frame decode is one index instead of four branches.
+    # Opposing keys resolve like the old if-chain did: right and down win.
+    lut = []
+    for mask in range(16):
+        vx = vy = 0
+        if mask & 1:
+            vx = -1
+        if mask & 2:
+            vx = 1
+        if mask & 4:
+            vy = -1
+        if mask & 8:
+            vy = 1
+        lut.append(_MOVE[(vx, vy)])
+    return lut
+
+_DIR_LUT = _build_dir_lut()
 
 FONT_NAME = "freesansbold.ttf"
 
+# set True to mirror the combat log to stdout while debugging
+DEBUG_COMBAT = False
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -46,12 +86,47 @@ HIGHLIGHT = (255, 220, 60)
 
 # ---- Game Data Models ----
 
-@dataclass
+# Canonical item names, interned so every inventory holds one shared string
+# object per item type and name comparisons short-circuit on identity.
+SMALL_POTION = sys.intern("Small Potion")
+MANA_POTION = sys.intern("Mana Potion")
+LUCKY_CHARM = sys.intern("Lucky Charm")
+SPIRIT_CHARM = sys.intern("Spirit Charm")
+
+@dataclass(slots=True)
 class Item:
     name: str
     description: str
 
-@dataclass
+class InventoryBag(list):
+    """A list of Items plus a name -> count index.
+
+    The count index lets "do we have a potion?" checks answer in O(1)
+    instead of string-comparing the whole bag; the linear scan only runs
+    when the item is actually present. Add items via add() so the index
+    stays in sync.
+    """
+    def __init__(self, items=()):
+        super().__init__(items)
+        self._counts: dict = {}
+        for it in self:
+            self._counts[it.name] = self._counts.get(it.name, 0) + 1
+
+    def add(self, item: Item):
+        self.append(item)
+        self._counts[item.name] = self._counts.get(item.name, 0) + 1
+
+    def pop_first_of(self, name: str) -> Optional[Item]:
+        """Remove and return the first item with this name, or None."""
+        if not self._counts.get(name):
+            return None
+        for i, it in enumerate(self):
+            if it.name == name:
+                self._counts[name] -= 1
+                return self.pop(i)
+        return None
+
+@dataclass(slots=True)
 class PlayerState:
     name: str = "Hero"
     pclass: str = "Warrior"
@@ -62,27 +137,93 @@ class PlayerState:
     hp: int = 40
     max_mp: int = 10
     mp: int = 10
-    inventory: List[Item] = field(default_factory=list)
+    inventory: InventoryBag = field(default_factory=InventoryBag)
     gold: int = 10
     helped_spirit: bool = False
     has_charm: bool = False
+    defending: bool = False  # combat-only: halves incoming damage this turn
+    # derived combat chances, cached so per-action rolls don't redo the
+    # arithmetic; call recompute_derived() after any agility change
+    crit_chance: float = field(init=False, default=0.0)
+    flee_chance: float = field(init=False, default=0.0)
+    enemy_hit_chance: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.recompute_derived()
 
-@dataclass
+    def recompute_derived(self):
+        self.crit_chance = 0.05 + self.agility * 0.01
+        self.flee_chance = 0.35 + self.agility * 0.02
+        self.enemy_hit_chance = 0.7 - self.agility * 0.01
+
+# Starting loadout per class: hp/mp begin at their maxima and each (name,
+# description) pair becomes a fresh Item when the character is created.
+CLASS_STATS = {
+    "Warrior": {"strength": 8, "agility": 5, "magic": 2, "max_hp": 40, "max_mp": 10,
+                "items": ((SMALL_POTION, "Heals 20 HP"), (LUCKY_CHARM, "Small heal + gold"))},
+    "Mage": {"strength": 2, "agility": 4, "magic": 9, "max_hp": 26, "max_mp": 30,
+             "items": ((MANA_POTION, "Restore MP"), (MANA_POTION, "Restore MP"))},
+    "Rogue": {"strength": 6, "agility": 8, "magic": 4, "max_hp": 32, "max_mp": 15,
+              "items": ((SMALL_POTION, "Heals 20 HP"), ("Dagger", "A small blade"))},
+}
+
+@dataclass(slots=True)
 class GameObject:
     x: float
     y: float
     w: int
     h: int
     name: str
+    _rect: pygame.Rect = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Build the Rect once and reuse it: scene objects never move, and the
+        # player calls sync_rect() after moving. Saves a Rect allocation (plus
+        # four float->int conversions) per collision check per frame.
+        self._rect = pygame.Rect(int(self.x), int(self.y), self.w, self.h)
 
     def rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), self.w, self.h)
+        return self._rect
+
+    def sync_rect(self):
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
 
 # ---- Utilities ----
 
+# Font objects are expensive to build (font file load + glyph tables), so keep
+# one per size instead of constructing a new one on every draw_text call.
+_FONT_CACHE: dict = {}
+
+def get_font(size):
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE.setdefault(size, pygame.font.Font(FONT_NAME, size))
+    return font
+
+# Rendered text surfaces, keyed by (text, size, color). Almost every string we
+# draw (labels, HUD, action hints) is identical frame to frame, so rasterizing
+# the glyphs once and re-blitting the cached Surface skips font.render on the
+# steady-state frame. Capped so one-off strings can't grow it forever.
+_TEXT_CACHE: OrderedDict = OrderedDict()
+_TEXT_CACHE_MAX = 256
+
+def render_text(text, size, color):
+    key = (text, size, color)
+    rendered = _TEXT_CACHE.get(key)
+    if rendered is None:
+        rendered = get_font(size).render(text, True, color)
+        if pygame.display.get_surface() is not None:
+            # match the display's pixel format so blits take SDL's fast
+            # path instead of converting per-pixel alpha on every blit
+            rendered = rendered.convert_alpha()
+        _TEXT_CACHE[key] = rendered
+        if len(_TEXT_CACHE) > _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)  # evict oldest entry
+    return rendered
+
 def draw_text(surface, text, x, y, size=20, color=BLACK, center=False):
-    font = pygame.font.Font(FONT_NAME, size)
-    rendered = font.render(text, True, color)
+    rendered = render_text(text, size, color)
     rect = rendered.get_rect()
     if center:
         rect.center = (x, y)
@@ -110,10 +251,57 @@ class MapScene:
         self.npcs: List[GameObject] = []
         self.items: List[Tuple[GameObject, Item]] = []
         self.enemies: List[GameObject] = []
+        # parallel Rect lists so collision tests can run through
+        # Rect.collidelist / collidelistall in C instead of a Python loop
+        self.item_rects: List[pygame.Rect] = []
+        self.npc_rects: List[pygame.Rect] = []
+        self.enemy_rects: List[pygame.Rect] = []
+        # obstacle rects bucketed by OBSTACLE_CELL-sized grid cell; only
+        # valid for static obstacles (true here), see build_obstacle_grid
+        self.obstacle_grid: dict = {}
+        # cached render of everything static (background, obstacles, items,
+        # npcs, enemies + labels); rebuilt lazily after object changes
+        self._bg: Optional[pygame.Surface] = None
         self.width = SCREEN_WIDTH
         self.height = SCREEN_HEIGHT
 
-    def draw(self, surf):
+    def build_obstacle_grid(self):
+        """Bucket obstacle rects into grid cells; call once after adding them.
+
+        Movement collision then only tests the few obstacles near the player
+        instead of every obstacle on the map.
+        """
+        self.obstacle_grid = {}
+        for r in self.obstacles:
+            for cx in range(r.left // OBSTACLE_CELL, r.right // OBSTACLE_CELL + 1):
+                for cy in range(r.top // OBSTACLE_CELL, r.bottom // OBSTACLE_CELL + 1):
+                    self.obstacle_grid.setdefault((cx, cy), []).append(r)
+
+    def obstacle_hit(self, rect) -> bool:
+        """True if rect overlaps any obstacle, testing only nearby grid cells."""
+        grid = self.obstacle_grid
+        for cx in range(rect.left // OBSTACLE_CELL, rect.right // OBSTACLE_CELL + 1):
+            for cy in range(rect.top // OBSTACLE_CELL, rect.bottom // OBSTACLE_CELL + 1):
+                bucket = grid.get((cx, cy))
+                if bucket and rect.collidelist(bucket) != -1:
+                    return True
+        return False
+
+    def sync_rect_lists(self):
+        """Rebuild the parallel Rect lists; call after adding/removing objects.
+
+        Also drops the cached background render, since an object change means
+        the static picture is stale.
+        """
+        self.item_rects = [go.rect() for go, _ in self.items]
+        self.npc_rects = [npc.rect() for npc in self.npcs]
+        self.enemy_rects = [en.rect() for en in self.enemies]
+        self._bg = None
+
+    def _build_bg(self):
+        # convert() so the cached surface matches the display format and
+        # the per-frame blit takes SDL's fast path
+        surf = pygame.Surface((self.width, self.height)).convert()
         surf.fill(self.bg_color)
         # draw obstacles
         for r in self.obstacles:
@@ -130,6 +318,14 @@ class MapScene:
         for en in self.enemies:
             pygame.draw.rect(surf, ENEMY_COLOR, en.rect())
             draw_text(surf, en.name, en.x, en.y - 16, size=14)
+        return surf
+
+    def draw(self, surf):
+        # nothing in the scene moves, so the whole thing is one cached blit;
+        # Game.run draws the player (the only mover) on top
+        if self._bg is None:
+            self._bg = self._build_bg()
+        surf.blit(self._bg, (0, 0))
 
 # ---- Scenes constructors ----
 
@@ -141,7 +337,9 @@ def create_village_scene():
     # NPC: elder for tutorial
     s.npcs.append(GameObject(480, 300, 28, 32, "Elder"))
     # No enemies here; add an item chest
-    s.items.append((GameObject(200, 420, 24, 24, "Chest"), Item("Small Potion", "Heals 20 HP")))
+    s.items.append((GameObject(200, 420, 24, 24, "Chest"), Item(SMALL_POTION, "Heals 20 HP")))
+    s.build_obstacle_grid()
+    s.sync_rect_lists()
     return s
 
 def create_forest_scene():
@@ -157,7 +355,9 @@ def create_forest_scene():
     s.enemies.append(GameObject(300, 240, 28, 28, "Goblin"))
     s.enemies.append(GameObject(500, 420, 28, 28, "Bandit"))
     # an extra item
-    s.items.append((GameObject(100, 520, 24, 24, "Glint"), Item("Lucky Charm", "Feels lucky. Small heal + gold.")))
+    s.items.append((GameObject(100, 520, 24, 24, "Glint"), Item(LUCKY_CHARM, "Feels lucky. Small heal + gold.")))
+    s.build_obstacle_grid()
+    s.sync_rect_lists()
     return s
 
 def create_castle_scene():
@@ -169,17 +369,82 @@ def create_castle_scene():
     # Inner guardian (placed near center; interaction will start final event)
     s.npcs.append(GameObject(480, 320, 48, 60, "Ancient Guardian"))
     # Castle item (key)
-    s.items.append((GameObject(200, 200, 24, 24, "Banner"), Item("Spirit Charm", "A charm granted by a grateful spirit.")))
+    s.items.append((GameObject(200, 200, 24, 24, "Banner"), Item(SPIRIT_CHARM, "A charm granted by a grateful spirit.")))
+    s.build_obstacle_grid()
+    s.sync_rect_lists()
     return s
 
+# ---- Combat math kernels ----
+# Pure numeric roll/damage functions, kept free of pygame and UI state so
+# batch work (AI auto-battles, Monte-Carlo balance sims) can drive them in a
+# tight loop -- or hand them to a JIT compiler wholesale, if that ever pays.
+
+# The kernels draw uniform floats from a pre-filled buffer rather than
+# calling the RNG per roll. A single interactive action won't notice, but
+# batch runs amortize the fill over 256 draws, and every integer roll below
+# becomes one multiply instead of a randint call (which re-validates its
+# bounds every time). The fill is one line to swap for a vectorized
+# generator if the project ever grows one.
+_ROLL_BUF_SIZE = 256
+_roll_buf: List[float] = []
+
+def _next_roll() -> float:
+    """Return a uniform float in [0, 1) from the shared roll buffer."""
+    global _roll_buf
+    if not _roll_buf:
+        _roll_buf = [random.random() for _ in range(_ROLL_BUF_SIZE)]
+    return _roll_buf.pop()
+
+def roll_attack(strength, crit_chance):
+    """Return (damage, crit) for a basic player attack."""
+    crit = _next_roll() < crit_chance
+    dmg = 3 + strength + int(_next_roll() * 5)  # +0..4
+    if crit:
+        dmg = int(dmg * 1.5)
+    return dmg, crit
+
+def roll_spell(magic):
+    """Return damage for a spell cast."""
+    return magic + 4 + int(_next_roll() * 7)  # +0..6
+
+def roll_enemy_attack(enemy_str, hit_chance):
+    """Return damage dealt by the enemy, or -1 on a miss."""
+    if _next_roll() < hit_chance:
+        return enemy_str + int(_next_roll() * 4)  # +0..3
+    return -1
+
+def roll_flee(flee_chance):
+    """Return True if a flee attempt succeeds."""
+    return _next_roll() < flee_chance
+
 # ---- Combat system (turn-based visual) ----
 
+# Base stats for every enemy the player can meet, looked up by the name of
+# the GameObject that triggered combat; "Wolf" is the fallback. Templates
+# are copied per fight so combat can mutate hp freely.
+ENEMY_TEMPLATES = {
+    "Goblin": {"name": "Goblin", "hp": 20, "str": 4, "agi": 3, "lvl": 1},
+    "Bandit": {"name": "Bandit Leader", "hp": 30, "str": 6, "agi": 4, "lvl": 2},
+    "Bandit Leader": {"name": "Bandit Leader", "hp": 30, "str": 6, "agi": 4, "lvl": 2},
+    "Ancient Guardian": {"name": "Ancient Guardian", "hp": 70, "str": 10, "agi": 3, "lvl": 5},
+    "Wolf": {"name": "Wolf", "hp": 18, "str": 5, "agi": 5, "lvl": 1},
+}
+
 class CombatScreen:
     """
     Minimal turn-based combat screen. Uses player's stats and a simple enemy stat model.
     Displayed when player collides an enemy.
     Controls: keys A=Attack, D=Defend, M=Magic, I=Use Item, F=Flee
     """
+
+    # screen regions that change during a fight: player HP/MP, enemy HP,
+    # and the combat log (everything else lives on the static backdrop)
+    DYNAMIC_RECTS = (
+        pygame.Rect(120, 120, 300, 46),
+        pygame.Rect(640, 120, 260, 18),
+        pygame.Rect(60, 360, SCREEN_WIDTH - 120, 9 * 22),
+    )
+
     def __init__(self, screen, clock, player: PlayerState, enemy_name: str):
         self.screen = screen
         self.clock = clock
@@ -187,56 +452,67 @@ class CombatScreen:
         self.enemy_name = enemy_name
         # enemy stats simple factory
         self.enemy = self.make_enemy(enemy_name)
-        self.log: List[str] = []
+        # bounded: the display shows at most 9 lines, and a deque trims the
+        # oldest in O(1) where list.pop(0) shifted every element
+        self.log: deque = deque(maxlen=9)
         self.player.defending = False  # temp field used in combat only
         self.finished = False
         self.victory = False
+        self._shown_once = False  # first draw must update the full screen
+        # everything that never changes during the fight (backdrop, stat
+        # boxes, title, action hint) is rendered once; draw() blits it and
+        # only renders the HP/MP/log lines on top
+        self._static = self._build_static()
+
+    def _build_static(self):
+        surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        surf.fill((30, 30, 40))
+        draw_text(surf, f"Combat: {self.player.name} vs {self.enemy['name']}", SCREEN_WIDTH//2, 20, size=28, color=WHITE, center=True)
+        # player box
+        pygame.draw.rect(surf, (50, 100, 150), (60, 80, 360, 220))
+        draw_text(surf, f"{self.player.name} ({self.player.pclass})", 120, 92, size=20, color=WHITE)
+        # enemy box
+        pygame.draw.rect(surf, (140, 50, 50), (540, 80, 360, 220))
+        draw_text(surf, f"{self.enemy['name']}", 640, 92, size=20, color=WHITE)
+        # actions hint
+        draw_text(surf, "Actions: [A]ttack  [D]efend  [M]agic  [I]tem  [F]lee", SCREEN_WIDTH//2, 320, size=20, center=True)
+        return surf
 
     def make_enemy(self, name):
-        if name == "Goblin":
-            return {"name": "Goblin", "hp": 20, "str": 4, "agi": 3, "lvl": 1}
-        if name == "Bandit" or name == "Bandit Leader":
-            return {"name": "Bandit Leader", "hp": 30, "str": 6, "agi": 4, "lvl": 2}
-        if name == "Ancient Guardian":
-            return {"name": "Ancient Guardian", "hp": 70, "str": 10, "agi": 3, "lvl": 5}
-        # default wolf
-        return {"name": "Wolf", "hp": 18, "str": 5, "agi": 5, "lvl": 1}
+        tpl = ENEMY_TEMPLATES.get(name)
+        if tpl is None:
+            tpl = ENEMY_TEMPLATES["Wolf"]
+        return dict(tpl)
 
     def append(self, text):
-        print("[COMBAT]", text)
-        self.log.append(text)
-        if len(self.log) > 9:
-            self.log.pop(0)
+        if DEBUG_COMBAT:
+            print("[COMBAT]", text)
+        self.log.append(text)  # deque(maxlen=9) drops the oldest line itself
 
     def draw(self):
-        # background and UI
-        self.screen.fill((30, 30, 40))
-        draw_text(self.screen, f"Combat: {self.player.name} vs {self.enemy['name']}", SCREEN_WIDTH//2, 20, size=28, color=WHITE, center=True)
-        # player box
-        pygame.draw.rect(self.screen, (50, 100, 150), (60, 80, 360, 220))
-        draw_text(self.screen, f"{self.player.name} ({self.player.pclass})", 120, 92, size=20, color=WHITE)
-        draw_text(self.screen, f"HP: {self.player.hp}/{self.player.max_hp}", 120, 120, size=18, color=WHITE)
+        # static backdrop and UI, rendered once at init
+        self.screen.blit(self._static, (0, 0))
+        # dynamic stats
+        # damage may take hp below zero; normalize only here, at display time
+        draw_text(self.screen, f"HP: {max(0, self.player.hp)}/{self.player.max_hp}", 120, 120, size=18, color=WHITE)
         draw_text(self.screen, f"MP: {self.player.mp}/{self.player.max_mp}", 120, 148, size=18, color=WHITE)
-        # enemy box
-        pygame.draw.rect(self.screen, (140, 50, 50), (540, 80, 360, 220))
-        draw_text(self.screen, f"{self.enemy['name']}", 640, 92, size=20, color=WHITE)
-        draw_text(self.screen, f"HP: {self.enemy['hp']}", 640, 120, size=18, color=WHITE)
-
-        # actions hint
-        draw_text(self.screen, "Actions: [A]ttack  [D]efend  [M]agic  [I]tem  [F]lee", SCREEN_WIDTH//2, 320, size=20, center=True)
+        draw_text(self.screen, f"HP: {max(0, self.enemy['hp'])}", 640, 120, size=18, color=WHITE)
 
         # combat log
         for i, line in enumerate(self.log):
             draw_text(self.screen, line, 60, 360 + i * 22, size=18, color=WHITE)
 
-        pygame.display.flip()
+        if self._shown_once:
+            # only the stat values and the log change between frames, so
+            # only those regions need to reach the display
+            pygame.display.update(self.DYNAMIC_RECTS)
+        else:
+            pygame.display.update()
+            self._shown_once = True
 
     def player_attack(self):
-        crit = random.random() < (0.05 + self.player.agility * 0.01)
-        base = 3 + self.player.strength
-        dmg = base + random.randint(0, 4)
+        dmg, crit = roll_attack(self.player.strength, self.player.crit_chance)
         if crit:
-            dmg = int(dmg * 1.5)
             self.append("Critical hit!")
         self.enemy['hp'] -= dmg
         self.append(f"You attack for {dmg} damage.")
@@ -247,7 +523,7 @@ class CombatScreen:
             self.append("Not enough MP.")
             return
         self.player.mp -= cost
-        dmg = self.player.magic + 4 + random.randint(0, 6)
+        dmg = roll_spell(self.player.magic)
         self.enemy['hp'] -= dmg
         self.append(f"You cast a spell for {dmg} magic damage.")
 
@@ -255,33 +531,40 @@ class CombatScreen:
         self.player.defending = True
         self.append("You brace to reduce incoming damage.")
 
+    def _use_small_potion(self):
+        self.player.hp = min(self.player.max_hp, self.player.hp + 20)
+        self.append("Used Small Potion. Healed 20 HP.")
+
+    def _use_mana_potion(self):
+        self.player.mp = min(self.player.max_mp, self.player.mp + 12)
+        self.append("Used Mana Potion. Restored MP.")
+
+    def _use_lucky_charm(self):
+        self.player.hp = min(self.player.max_hp, self.player.hp + 8)
+        self.player.gold += 5
+        self.append("Lucky Charm used: HP +8, Gold +5.")
+
+    def _use_spirit_charm(self):
+        self.player.has_charm = True
+        self.append("Spirit Charm hums; you feel protected.")
+
+    # usable items in priority order; new items only need a table entry
+    ITEM_HANDLERS = (
+        (SMALL_POTION, _use_small_potion),
+        (MANA_POTION, _use_mana_potion),
+        (LUCKY_CHARM, _use_lucky_charm),
+        (SPIRIT_CHARM, _use_spirit_charm),
+    )
+
     def player_use_item(self):
-        # pick first usable item: Small Potion, Mana Potion, Lucky Charm, Spirit Charm
-        if not self.player.inventory:
+        # use the first item we hold, in ITEM_HANDLERS priority order
+        bag = self.player.inventory
+        if not bag:
             self.append("No items to use.")
             return
-        # open a tiny selection logic: use first restorative item found
-        for i, it in enumerate(self.player.inventory):
-            if it.name == "Small Potion":
-                self.player.hp = clamp(self.player.max_hp, self.player.hp + 20, self.player.max_hp)
-                self.append("Used Small Potion. Healed 20 HP.")
-                self.player.inventory.pop(i)
-                return
-            if it.name == "Mana Potion":
-                self.player.mp = clamp(self.player.mp + 12, 0, self.player.max_mp)
-                self.append("Used Mana Potion. Restored MP.")
-                self.player.inventory.pop(i)
-                return
-            if it.name == "Lucky Charm":
-                self.player.hp = min(self.player.max_hp, self.player.hp + 8)
-                self.player.gold += 5
-                self.append("Lucky Charm used: HP +8, Gold +5.")
-                self.player.inventory.pop(i)
-                return
-            if it.name == "Spirit Charm":
-                self.player.has_charm = True
-                self.append("Spirit Charm hums; you feel protected.")
-                self.player.inventory.pop(i)
+        for name, handler in self.ITEM_HANDLERS:
+            if bag.pop_first_of(name):
+                handler(self)
                 return
         # nothing used
         self.append("No usable items found right now.")
@@ -290,10 +573,9 @@ class CombatScreen:
         if self.enemy['hp'] <= 0:
             return
         # simple enemy action
-        hit_chance = 0.7 - (self.player.agility * 0.01)
-        if random.random() < hit_chance:
-            dmg = self.enemy['str'] + random.randint(0, 3)
-            if getattr(self.player, "defending", False):
+        dmg = roll_enemy_attack(self.enemy['str'], self.player.enemy_hit_chance)
+        if dmg >= 0:
+            if self.player.defending:
                 dmg = dmg // 2
             self.player.hp -= dmg
             self.append(f"{self.enemy['name']} hits you for {dmg} damage.")
@@ -301,8 +583,7 @@ class CombatScreen:
             self.append(f"{self.enemy['name']} misses!")
 
     def attempt_flee(self):
-        chance = 0.35 + self.player.agility * 0.02
-        if random.random() < chance:
+        if roll_flee(self.player.flee_chance):
             self.append("You fled successfully.")
             self.finished = True
             self.victory = False
@@ -310,36 +591,38 @@ class CombatScreen:
             self.append("Flee failed!")
             self.enemy_turn()
 
+    # combat action per key, built once at class definition; run() then
+    # dispatches with a single dict lookup instead of an if/elif chain
+    KEY_ACTIONS = {
+        pygame.K_a: player_attack,
+        pygame.K_m: player_magic,
+        pygame.K_d: player_defend,
+        pygame.K_i: player_use_item,
+        pygame.K_f: attempt_flee,
+    }
+
     def run(self):
         # main loop for combat; returns dict with outcome
         while not self.finished:
             dt = self.clock.tick(FPS) / 1000.0
             self.draw()
-            for event in pygame.event.get():
+            for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
                 elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_a:
-                        self.player_attack()
-                    elif event.key == pygame.K_m:
-                        self.player_magic()
-                    elif event.key == pygame.K_d:
-                        self.player_defend()
-                    elif event.key == pygame.K_i:
-                        self.player_use_item()
-                    elif event.key == pygame.K_f:
-                        self.attempt_flee()
-                    else:
+                    action = self.KEY_ACTIONS.get(event.key)
+                    if action is None:
                         continue
+                    action(self)
                     # after player action, check enemy dead
                     if self.enemy['hp'] <= 0:
                         self.append(f"You defeated the {self.enemy['name']}!")
                         self.player.gold += self.enemy['lvl'] * 5
                         # simple loot: chance to drop small potion or mana potion
-                        if random.random() < 0.6:
-                            drop = Item("Small Potion", "Heals 20 HP")
-                            self.player.inventory.append(drop)
+                        if _next_roll() < 0.6:
+                            drop = Item(SMALL_POTION, "Heals 20 HP")
+                            self.player.inventory.add(drop)
                             self.append("Enemy dropped Small Potion.")
                         self.finished = True
                         self.victory = True
@@ -362,6 +645,11 @@ class CombatScreen:
 class Game:
     def __init__(self):
         pygame.init()
+        # the game only reacts to window-close and key presses; blocking
+        # everything else (mouse motion especially) at the SDL level keeps
+        # the per-frame event queue short and allocation-free
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
         pygame.display.set_caption("Top-down RPG (Pygame Demo)")
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         self.clock = pygame.time.Clock()
@@ -376,6 +664,30 @@ class Game:
         self.show_inventory = False
         self.message = "Press N to create a character and start."
         self.show_help = True
+        # snapshot of what the last drawn frame showed; run() skips the
+        # whole redraw when the next frame would be identical, and updates
+        # only the player's area when that is all that moved
+        self._last_frame_state = None
+        self._last_player_area = None
+        # inventory overlay, rendered once per inventory change/toggle and
+        # blitted as a single surface while open
+        self._inv_surf = None
+        # HUD stats line, re-formatted only when a stat actually changes
+        self._hud_key = None
+        self._hud_line = ""
+        # warm the font cache for the sizes we actually use, so the first
+        # frame that needs a size doesn't stutter on the load
+        for size in (14, 16, 18, 20, 22, 24, 28, 36, 44):
+            get_font(size)
+        # the message box backdrop is a constant solid rectangle; raster it
+        # once and blit (the inventory panel's backdrop is likewise part of
+        # the cached overlay surface)
+        self._msgbox_surf = pygame.Surface((SCREEN_WIDTH - 20, 60)).convert()
+        self._msgbox_surf.fill((230, 230, 230))
+        # the help banner never changes; render it once and blit directly
+        self._help_surf = render_text(
+            "Move: Arrows/WASD  Inventory: I  Next Scene / Interact: N  Help: H  Restart: R",
+            16, BLACK)
         # seed randomness
         random.seed()
 
@@ -387,13 +699,13 @@ class Game:
         # interactive choice via console input isn't great in GUI; instead random or defaults
         # To keep it simple, present a small on-screen prompt choices (press 1/2/3)
         choosing = True
+        # the prompt is static: draw it once, then just wait for a key
+        self.screen.fill((20, 20, 30))
+        draw_text(self.screen, "Create your character", SCREEN_WIDTH//2, 80, size=36, color=WHITE, center=True)
+        draw_text(self.screen, "Press 1 for Warrior, 2 for Mage, 3 for Rogue", SCREEN_WIDTH//2, 160, size=20, color=WHITE, center=True)
+        pygame.display.flip()
         while choosing:
-            # display prompt and wait for key
-            self.screen.fill((20, 20, 30))
-            draw_text(self.screen, "Create your character", SCREEN_WIDTH//2, 80, size=36, color=WHITE, center=True)
-            draw_text(self.screen, "Press 1 for Warrior, 2 for Mage, 3 for Rogue", SCREEN_WIDTH//2, 160, size=20, color=WHITE, center=True)
-            pygame.display.flip()
-            for ev in pygame.event.get():
+            for ev in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if ev.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit(0)
@@ -412,24 +724,18 @@ class Game:
                         choosing = False
             self.clock.tick(FPS)
 
-        # set stats depending on class
-        ps = PlayerState()
-        ps.name = name
-        ps.pclass = pclass
-        if pclass == "Warrior":
-            ps.strength = 8; ps.agility = 5; ps.magic = 2; ps.max_hp = 40; ps.max_mp = 10
-            ps.hp = ps.max_hp; ps.mp = ps.max_mp
-            ps.inventory = [Item("Small Potion","Heals 20 HP"), Item("Lucky Charm","Small heal + gold")]
-        elif pclass == "Mage":
-            ps.strength = 2; ps.agility = 4; ps.magic = 9; ps.max_hp = 26; ps.max_mp = 30
-            ps.hp = ps.max_hp; ps.mp = ps.max_mp
-            ps.inventory = [Item("Mana Potion","Restore MP"), Item("Mana Potion","Restore MP")]
-        elif pclass == "Rogue":
-            ps.strength = 6; ps.agility = 8; ps.magic = 4; ps.max_hp = 32; ps.max_mp = 15
-            ps.hp = ps.max_hp; ps.mp = ps.max_mp
-            ps.inventory = [Item("Small Potion","Heals 20 HP"), Item("Dagger","A small blade")]
-        ps.gold = 12
+        # build the character from the class table in one constructor call
+        stats = CLASS_STATS[pclass]
+        ps = PlayerState(
+            name=name, pclass=pclass,
+            strength=stats["strength"], agility=stats["agility"], magic=stats["magic"],
+            max_hp=stats["max_hp"], hp=stats["max_hp"],
+            max_mp=stats["max_mp"], mp=stats["max_mp"],
+            inventory=InventoryBag(Item(n, d) for n, d in stats["items"]),
+            gold=12,
+        )
         self.player_state = ps
+        self._inv_surf = None
         self.message = f"Welcome, {ps.name} the {ps.pclass}! Use arrow keys/WASD to move. Press I for inventory. Press H to toggle help."
         return ps
 
@@ -439,11 +745,14 @@ class Game:
         # reposition player near top-left for new map
         self.player_obj.x = 80
         self.player_obj.y = 80
+        self.player_obj.sync_rect()
 
-    def handle_item_pickup(self, go_obj, item: Item):
-        # add item to inventory and remove it from scene
-        self.player_state.inventory.append(item)
-        self.scene.items = [(g,i) for (g,i) in self.scene.items if g != go_obj]
+    def handle_item_pickup(self, idx: int, item: Item):
+        # add item to inventory and pop its scene entry by index, instead
+        # of rebuilding the whole items list per pickup
+        self.player_state.inventory.add(item)
+        self._inv_surf = None
+        self.scene.items.pop(idx)
         self.message = f"Picked up {item.name}!"
 
     def handle_npc_interaction(self, npc: GameObject):
@@ -456,7 +765,8 @@ class Game:
             chosen = self.ask_choice("A trapped spirit begs for help. Help it? (Y/N)")
             if chosen == 'Y':
                 self.player_state.helped_spirit = True
-                self.player_state.inventory.append(Item("Spirit Charm", "A protective charm"))
+                self.player_state.inventory.add(Item(SPIRIT_CHARM, "A protective charm"))
+                self._inv_surf = None
                 self.player_state.has_charm = True
                 self.message = "You freed the spirit. It grants you a Spirit Charm."
             else:
@@ -472,12 +782,13 @@ class Game:
         """Helper: display prompt and wait for Y or N press. Returns 'Y' or 'N'."""
         asking = True
         result = 'N'
+        # static prompt: render once, then only pump events until a choice
+        self.screen.fill((30, 30, 30))
+        draw_text(self.screen, prompt_text, SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20, size=28, color=WHITE, center=True)
+        draw_text(self.screen, "Press Y or N", SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30, size=20, color=WHITE, center=True)
+        pygame.display.flip()
         while asking:
-            self.screen.fill((30, 30, 30))
-            draw_text(self.screen, prompt_text, SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 20, size=28, color=WHITE, center=True)
-            draw_text(self.screen, "Press Y or N", SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 30, size=20, color=WHITE, center=True)
-            pygame.display.flip()
-            for ev in pygame.event.get():
+            for ev in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit(0)
                 if ev.type == pygame.KEYDOWN:
@@ -492,9 +803,12 @@ class Game:
         # create and run combat screen, using enemy_obj.name
         cs = CombatScreen(self.screen, self.clock, self.player_state, enemy_obj.name)
         result = cs.run()
+        # combat can consume items and drop loot
+        self._inv_surf = None
         # if victory, remove enemy from scene
         if result['victory']:
             self.scene.enemies = [e for e in self.scene.enemies if e != enemy_obj]
+            self.scene.sync_rect_lists()
             self.message = f"Defeated {enemy_obj.name}."
         else:
             if result.get("fled", False):
@@ -516,13 +830,13 @@ class Game:
 
     def display_ending_screen(self, typ, text):
         showing = True
+        self.screen.fill((10, 10, 10))
+        draw_text(self.screen, f"Ending: {typ}", SCREEN_WIDTH//2, 120, size=44, color=WHITE, center=True)
+        draw_text(self.screen, text, SCREEN_WIDTH//2, 200, size=22, color=WHITE, center=True)
+        draw_text(self.screen, "Press ESC to quit or R to restart.", SCREEN_WIDTH//2, 420, size=20, color=WHITE, center=True)
+        pygame.display.flip()
         while showing:
-            self.screen.fill((10, 10, 10))
-            draw_text(self.screen, f"Ending: {typ}", SCREEN_WIDTH//2, 120, size=44, color=WHITE, center=True)
-            draw_text(self.screen, text, SCREEN_WIDTH//2, 200, size=22, color=WHITE, center=True)
-            draw_text(self.screen, "Press ESC to quit or R to restart.", SCREEN_WIDTH//2, 420, size=20, color=WHITE, center=True)
-            pygame.display.flip()
-            for ev in pygame.event.get():
+            for ev in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit(0)
                 if ev.type == pygame.KEYDOWN:
@@ -534,76 +848,94 @@ class Game:
                         main()
             self.clock.tick(FPS)
 
+    def _guardian_battle(self, guardian_obj, good, neutral, bad):
+        # shared fight-then-ending tail for the befriend-failure and fight paths
+        res = self.transition_to_combat(guardian_obj)
+        if not res['victory']:
+            self.end_game("BAD", bad)
+        elif self.player_state.helped_spirit:
+            self.end_game("GOOD", good)
+        else:
+            self.end_game("NEUTRAL", neutral)
+
+    def _guardian_befriend(self, guardian_obj):
+        # require spirit charm or high magic
+        if self.player_state.has_charm or self.player_state.magic >= 8:
+            self.end_game("GOOD", "You spoke truly; the guardian accepts peace.")
+        else:
+            self.message = "Your words fail. The Guardian attacks!"
+            self._guardian_battle(
+                guardian_obj,
+                "You defeated it and the land heals faster (you helped spirit earlier).",
+                "You defeated it, but the cost was heavy.",
+                "You failed to subdue the Guardian.")
+
+    def _guardian_fight(self, guardian_obj):
+        self._guardian_battle(
+            guardian_obj,
+            "You defeated the Guardian; the spirits aid recovery.",
+            "You won, but peace will take time.",
+            "The Guardian defeated you.")
+
+    def _guardian_trick(self, guardian_obj):
+        # a won trick-battle is never GOOD, so this path skips _guardian_battle
+        chance = 0.25 + (self.player_state.agility * 0.03) + (self.player_state.magic * 0.02)
+        if _next_roll() < chance:
+            self.end_game("GOOD", "Your trick works and the Guardian steps aside.")
+        else:
+            self.message = "Trick failed; Guardian attacks!"
+            res = self.transition_to_combat(guardian_obj)
+            if not res['victory']:
+                self.end_game("BAD", "You were defeated while attempting a trick.")
+            else:
+                self.end_game("NEUTRAL", "You prevailed but the victory feels hollow.")
+
+    # choice key -> handler, resolved once at class build like KEY_ACTIONS
+    GUARDIAN_CHOICES = {
+        pygame.K_b: _guardian_befriend,
+        pygame.K_f: _guardian_fight,
+        pygame.K_t: _guardian_trick,
+    }
+
     def final_guardian_event(self, guardian_obj: GameObject):
         # Player stands before Guardian; provide three options: Befriend / Fight / Trick
         # Show on-screen menu
-        chosen = None
-        while chosen is None:
-            self.screen.fill((30,30,40))
-            draw_text(self.screen, "The Ancient Guardian stands before you.", SCREEN_WIDTH//2, 80, size=28, color=WHITE, center=True)
-            draw_text(self.screen, "[B]efriend   [F]ight   [T]rick", SCREEN_WIDTH//2, 160, size=24, color=WHITE, center=True)
-            draw_text(self.screen, "Press the corresponding key to choose.", SCREEN_WIDTH//2, 220, size=18, color=WHITE, center=True)
-            pygame.display.flip()
-            for ev in pygame.event.get():
+        self.screen.fill((30,30,40))
+        draw_text(self.screen, "The Ancient Guardian stands before you.", SCREEN_WIDTH//2, 80, size=28, color=WHITE, center=True)
+        draw_text(self.screen, "[B]efriend   [F]ight   [T]rick", SCREEN_WIDTH//2, 160, size=24, color=WHITE, center=True)
+        draw_text(self.screen, "Press the corresponding key to choose.", SCREEN_WIDTH//2, 220, size=18, color=WHITE, center=True)
+        pygame.display.flip()
+        while True:
+            for ev in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if ev.type == pygame.QUIT:
                     pygame.quit(); sys.exit(0)
                 if ev.type == pygame.KEYDOWN:
-                    if ev.key == pygame.K_b:
-                        chosen = 'B'
-                    elif ev.key == pygame.K_f:
-                        chosen = 'F'
-                    elif ev.key == pygame.K_t:
-                        chosen = 'T'
+                    handler = self.GUARDIAN_CHOICES.get(ev.key)
+                    if handler is not None:
+                        handler(self, guardian_obj)
+                        return
             self.clock.tick(FPS)
-        # Resolve choices
-        if chosen == 'B':
-            # require spirit charm or high magic
-            if self.player_state.has_charm or self.player_state.magic >= 8:
-                self.end_game("GOOD", "You spoke truly; the guardian accepts peace.")
-            else:
-                # fail, force combat
-                self.message = "Your words fail. The Guardian attacks!"
-                res = self.transition_to_combat(guardian_obj)
-                if not res['victory']:
-                    self.end_game("BAD", "You failed to subdue the Guardian.")
-                else:
-                    # if helped spirit earlier -> good, else neutral
-                    if self.player_state.helped_spirit:
-                        self.end_game("GOOD", "You defeated it and the land heals faster (you helped spirit earlier).")
-                    else:
-                        self.end_game("NEUTRAL", "You defeated it, but the cost was heavy.")
-        elif chosen == 'F':
-            res = self.transition_to_combat(guardian_obj)
-            if not res['victory']:
-                self.end_game("BAD", "The Guardian defeated you.")
-            else:
-                if self.player_state.helped_spirit:
-                    self.end_game("GOOD", "You defeated the Guardian; the spirits aid recovery.")
-                else:
-                    self.end_game("NEUTRAL", "You won, but peace will take time.")
-        elif chosen == 'T':
-            chance = 0.25 + (self.player_state.agility * 0.03) + (self.player_state.magic * 0.02)
-            if random.random() < chance:
-                self.end_game("GOOD", "Your trick works and the Guardian steps aside.")
-            else:
-                self.message = "Trick failed; Guardian attacks!"
-                res = self.transition_to_combat(guardian_obj)
-                if not res['victory']:
-                    self.end_game("BAD", "You were defeated while attempting a trick.")
-                else:
-                    self.end_game("NEUTRAL", "You prevailed but the victory feels hollow.")
-        else:
-            self.message = "You hesitated and the moment passed."
+
+    def _build_inventory_overlay(self):
+        # render the panel plus one line per item into a single surface;
+        # the frame loop then blits it until the inventory changes again
+        surf = pygame.Surface((520, 420)).convert()
+        surf.fill((30, 30, 30))
+        draw_text(surf, "Inventory (press I to close)", 260, 20, size=22, color=WHITE, center=True)
+        for i, it in enumerate(self.player_state.inventory):
+            draw_text(surf, f"{i+1}. {it.name} - {it.description}", 40, 60 + i*28, size=18, color=WHITE)
+        return surf
 
     # ---- Main game loop ----
     def run(self):
         # Create player first
         if not self.player_state:
             self.create_player()
-        dt = 0
         while self.running:
+            # tick once at the top so every consumer of dt this frame agrees
+            dt = self.clock.tick(FPS) / 1000.0
             # handle events
-            for event in pygame.event.get():
+            for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.KEYDOWN:
@@ -635,56 +967,64 @@ class Game:
 
             # movement handling
             keys = pygame.key.get_pressed()
-            vx = vy = 0
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-                vx = -1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-                vx = 1
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
-                vy = -1
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-                vy = 1
-            # normalize diagonal
-            if vx != 0 and vy != 0:
-                vx *= 0.7071; vy *= 0.7071
-            # move with delta
-            move_x = vx * PLAYER_SPEED * (self.clock.get_time() / 1000.0)
-            move_y = vy * PLAYER_SPEED * (self.clock.get_time() / 1000.0)
-            # tentative move and collision with scene obstacles
+            # pack the four directions into a bitmask and look up the
+            # (normalized) velocity; scale by this frame's delta
+            mask = ((keys[pygame.K_LEFT] | keys[pygame.K_a])
+                    | (keys[pygame.K_RIGHT] | keys[pygame.K_d]) << 1
+                    | (keys[pygame.K_UP] | keys[pygame.K_w]) << 2
+                    | (keys[pygame.K_DOWN] | keys[pygame.K_s]) << 3)
+            speed_x, speed_y = _DIR_LUT[mask]
+            move_x = speed_x * dt
+            move_y = speed_y * dt
+            # tentative move and collision with scene obstacles; collidelist
+            # runs the whole AABB scan in C and returns -1 on no hit
             next_rect = self.player_obj.rect().move(move_x, 0)
-            blocked = False
-            for obs in self.scene.obstacles:
-                if next_rect.colliderect(obs):
-                    blocked = True; break
-            if not blocked:
+            if not self.scene.obstacle_hit(next_rect):
                 self.player_obj.x += move_x
+                self.player_obj.sync_rect()
             next_rect = self.player_obj.rect().move(0, move_y)
-            blocked = False
-            for obs in self.scene.obstacles:
-                if next_rect.colliderect(obs):
-                    blocked = True; break
-            if not blocked:
+            if not self.scene.obstacle_hit(next_rect):
                 self.player_obj.y += move_y
+                self.player_obj.sync_rect()
 
-            # check item pickups
-            for go, item in list(self.scene.items):
-                if self.player_obj.rect().colliderect(go.rect()):
-                    self.handle_item_pickup(go, item)
+            player_rect = self.player_obj.rect()
+
+            # check item pickups; collidelistall gives every overlap at once,
+            # so Python only runs for the rare frame with an actual pickup
+            hits = player_rect.collidelistall(self.scene.item_rects)
+            if hits:
+                # pop from the back so the earlier hit indices stay valid
+                for idx in reversed(hits):
+                    self.handle_item_pickup(idx, self.scene.items[idx][1])
+                self.scene.sync_rect_lists()
 
             # check NPC interactions proximity (press N to interact)
             # But we also handle if player walks directly onto NPC -> auto-interact
-            for npc in self.scene.npcs:
-                if self.player_obj.rect().colliderect(npc.rect()):
-                    self.handle_npc_interaction(npc)
+            for i in player_rect.collidelistall(self.scene.npc_rects):
+                self.handle_npc_interaction(self.scene.npcs[i])
 
             # check enemy collision -> start combat
-            for en in list(self.scene.enemies):
-                if self.player_obj.rect().colliderect(en.rect()):
-                    # start combat
-                    res = self.transition_to_combat(en)
-                    if not self.player_state.hp > 0:
-                        self.running = False
-                        break
+            hit = player_rect.collidelist(self.scene.enemy_rects)
+            if hit != -1:
+                res = self.transition_to_combat(self.scene.enemies[hit])
+                if not self.player_state.hp > 0:
+                    self.running = False
+
+            # skip the redraw entirely when nothing visible changed since the
+            # previous frame (standing still, same message/stats/overlays) --
+            # the screen already shows exactly this state
+            frame_state = (
+                self.scene_index,
+                player_rect.x, player_rect.y,
+                self.player_state.hp, self.player_state.mp, self.player_state.gold,
+                len(self.player_state.inventory),
+                len(self.scene.items), len(self.scene.enemies),
+                self.message, self.show_inventory, self.show_help,
+            )
+            if frame_state == self._last_frame_state:
+                continue
+            prev_state = self._last_frame_state
+            self._last_frame_state = frame_state
 
             # drawing scene
             self.scene.draw(self.screen)
@@ -693,21 +1033,36 @@ class Game:
             draw_text(self.screen, self.player_state.name if self.player_state else "NoName", self.player_obj.x, self.player_obj.y - 16, size=14)
             # UI HUD
             draw_text(self.screen, f"Location: {self.scene.name}", 12, 8, size=18)
-            draw_text(self.screen, f"HP: {self.player_state.hp}/{self.player_state.max_hp}  MP: {self.player_state.mp}/{self.player_state.max_mp}  Gold: {self.player_state.gold}", 12, 30, size=16)
+            ps = self.player_state
+            stats_key = (ps.hp, ps.max_hp, ps.mp, ps.max_mp, ps.gold)
+            if stats_key != self._hud_key:
+                self._hud_key = stats_key
+                self._hud_line = f"HP: {max(0, ps.hp)}/{ps.max_hp}  MP: {ps.mp}/{ps.max_mp}  Gold: {ps.gold}"
+            draw_text(self.screen, self._hud_line, 12, 30, size=16)
             if self.show_help:
-                draw_text(self.screen, "Move: Arrows/WASD  Inventory: I  Next Scene / Interact: N  Help: H  Restart: R", 12, SCREEN_HEIGHT - 28, size=16)
+                self.screen.blit(self._help_surf, (12, SCREEN_HEIGHT - 28))
             # message box
-            pygame.draw.rect(self.screen, (230, 230, 230), (10, SCREEN_HEIGHT - 90, SCREEN_WIDTH - 20, 60))
+            self.screen.blit(self._msgbox_surf, (10, SCREEN_HEIGHT - 90))
             draw_text(self.screen, f"{self.message}", 18, SCREEN_HEIGHT - 82, size=18)
 
-            # inventory overlay
+            # inventory overlay (rebuilt only when the inventory changed)
             if self.show_inventory:
-                pygame.draw.rect(self.screen, (30,30,30), (220, 100, 520, 420))
-                draw_text(self.screen, "Inventory (press I to close)", SCREEN_WIDTH//2, 120, size=22, color=WHITE, center=True)
-                for i, it in enumerate(self.player_state.inventory):
-                    draw_text(self.screen, f"{i+1}. {it.name} - {it.description}", 260, 160 + i*28, size=18, color=WHITE)
-            pygame.display.flip()
-            self.clock.tick(FPS)
+                if self._inv_surf is None:
+                    self._inv_surf = self._build_inventory_overlay()
+                self.screen.blit(self._inv_surf, (220, 100))
+
+            # push only the changed pixels to the display: when just the
+            # player moved, that's the union of its old and new areas (name
+            # label included); any other change updates the whole frame
+            player_area = pygame.Rect(player_rect.x - 50, player_rect.y - 20,
+                                      player_rect.w + 100, player_rect.h + 24)
+            if (prev_state is not None and prev_state[0] == frame_state[0]
+                    and prev_state[3:] == frame_state[3:]):
+                area = self._last_player_area
+                pygame.display.update(player_area.union(area) if area else player_area)
+            else:
+                pygame.display.update()
+            self._last_player_area = player_area
         pygame.quit()
 
 # ---- Entry point ----